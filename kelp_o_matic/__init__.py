@@ -1,7 +1,20 @@
-from kelp_o_matic.lib import find_kelp, find_mussels
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from kelp_o_matic.lib import find_kelp, find_mussels
 
 __all__ = [
     "find_kelp",
     "find_mussels",
 ]
 __version__ = "0.0.0"
+
+
+def __getattr__(name: str):
+    # Defer importing torch, torchvision and rasterio until the library API is
+    # first used so light-weight entry points like `kom --version` start quickly.
+    if name in __all__:
+        from kelp_o_matic import lib
+
+        return getattr(lib, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
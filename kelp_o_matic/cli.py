@@ -1,40 +1,65 @@
 from pathlib import Path
 from typing import Annotated, Optional
 
-import torch
 import typer
 
-from kelp_o_matic import (
-    __version__,
-    find_kelp as find_kelp_,
-    find_mussels as find_mussels_,
-)
+from kelp_o_matic import __version__
 
 cli = typer.Typer(context_settings={"help_option_names": ["-h", "--help"]}, add_completion=False)
 
 
+_SourceArg = Annotated[
+    Path,
+    typer.Argument(
+        exists=True,
+        dir_okay=False,
+        file_okay=True,
+        readable=True,
+        help="Input image with Byte data type.",
+    ),
+]
+_DestArg = Annotated[
+    Path,
+    typer.Argument(
+        exists=False,
+        dir_okay=False,
+        file_okay=True,
+        writable=True,
+        help="File path location to save output to.",
+    ),
+]
+_CropSizeOpt = Annotated[
+    int,
+    typer.Option(
+        help="The data window size to run through the segmentation model.",
+    ),
+]
+_BandOrderOpt = Annotated[
+    Optional[list[int]],
+    typer.Option(
+        "-b",
+        help="GDAL-style band re-ordering flag. Defaults to RGB or RGBI order. "
+        "To e.g., reorder a BGRI image at runtime, pass flags `-b 3 -b 2 -b 1 -b 4`.",
+    ),
+]
+_UseGpuOpt = Annotated[
+    bool,
+    typer.Option("--gpu/--no-gpu", help="Enable or disable GPU, if available."),
+]
+_UseTtaOpt = Annotated[
+    bool,
+    typer.Option(
+        "--tta/--no-tta",
+        help="Use test time augmentation to improve accuracy at the cost of "
+        "processing time.",
+    ),
+]
+
+
 @cli.command()
 def find_kelp(
-    source: Annotated[
-        Path,
-        typer.Argument(
-            exists=True,
-            dir_okay=False,
-            file_okay=True,
-            readable=True,
-            help="Input image with Byte data type.",
-        ),
-    ],
-    dest: Annotated[
-        Path,
-        typer.Argument(
-            exists=False,
-            dir_okay=False,
-            file_okay=True,
-            writable=True,
-            help="File path location to save output to.",
-        ),
-    ],
+    source: _SourceArg,
+    dest: _DestArg,
     species: Annotated[
         bool,
         typer.Option(
@@ -42,12 +67,7 @@ def find_kelp(
             help="Segment to species or presence/absence level.",
         ),
     ] = False,
-    crop_size: Annotated[
-        int,
-        typer.Option(
-            help="The data window size to run through the segmentation model.",
-        ),
-    ] = 1024,
+    crop_size: _CropSizeOpt = 1024,
     use_nir: Annotated[
         bool,
         typer.Option(
@@ -55,87 +75,34 @@ def find_kelp(
             help="Use RGB and NIR bands for classification. Assumes RGBI ordering.",
         ),
     ] = False,
-    band_order: Annotated[
-        Optional[list[int]],
-        typer.Option(
-            "-b",
-            help="GDAL-style band re-ordering flag. Defaults to RGB or RGBI order. "
-            "To e.g., reorder a BGRI image at runtime, pass flags `-b 3 -b 2 -b 1 -b 4`.",
-        ),
-    ] = None,
-    use_gpu: Annotated[
-        bool,
-        typer.Option("--gpu/--no-gpu", help="Enable or disable GPU, if available."),
-    ] = True,
-    use_tta: Annotated[
-        bool,
-        typer.Option(
-            "--tta/--no-tta",
-            help="Use test time augmentation to improve accuracy at the cost of "
-            "processing time.",
-        ),
-    ] = False,
+    band_order: _BandOrderOpt = None,
+    use_gpu: _UseGpuOpt = True,
+    use_tta: _UseTtaOpt = False,
 ):
     """
     Detect kelp in image at path SOURCE and output the resulting classification raster
     to file at path DEST.
     """
+    from kelp_o_matic import find_kelp as find_kelp_
+
     find_kelp_(source, dest, species, crop_size, use_nir, band_order, use_gpu, use_tta)
 
 
 @cli.command()
 def find_mussels(
-    source: Annotated[
-        Path,
-        typer.Argument(
-            exists=True,
-            dir_okay=False,
-            file_okay=True,
-            readable=True,
-            help="Input image with Byte data type.",
-        ),
-    ],
-    dest: Annotated[
-        Path,
-        typer.Argument(
-            exists=False,
-            dir_okay=False,
-            file_okay=True,
-            writable=True,
-            help="File path location to save output to.",
-        ),
-    ],
-    crop_size: Annotated[
-        int,
-        typer.Option(
-            help="The data window size to run through the segmentation model.",
-        ),
-    ] = 1024,
-    band_order: Annotated[
-        Optional[list[int]],
-        typer.Option(
-            "-b",
-            help="GDAL-style band re-ordering flag. Defaults to RGB or RGBI order. "
-            "To e.g., reorder a BGRI image at runtime, pass flags `-b 3 -b 2 -b 1 -b 4`.",
-        ),
-    ] = None,
-    use_gpu: Annotated[
-        bool,
-        typer.Option("--gpu/--no-gpu", help="Enable or disable GPU, if available."),
-    ] = True,
-    use_tta: Annotated[
-        bool,
-        typer.Option(
-            "--tta/--no-tta",
-            help="Use test time augmentation to improve accuracy at the cost of "
-            "processing time.",
-        ),
-    ] = False,
+    source: _SourceArg,
+    dest: _DestArg,
+    crop_size: _CropSizeOpt = 1024,
+    band_order: _BandOrderOpt = None,
+    use_gpu: _UseGpuOpt = True,
+    use_tta: _UseTtaOpt = False,
 ):
     """
     Detect mussels in image at path SOURCE and output the resulting classification
     raster to file at path DEST.
     """
+    from kelp_o_matic import find_mussels as find_mussels_
+
     find_mussels_(source, dest, crop_size, band_order, use_gpu, use_tta)
 
 
@@ -147,6 +114,8 @@ def version_callback(value: bool) -> None:
 
 def gpu_callback(value: bool) -> None:
     if value:
+        import torch
+
         typer.echo(f"GPU detected: {torch.cuda.is_available()}")
         raise typer.Exit()
 
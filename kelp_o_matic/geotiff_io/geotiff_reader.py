@@ -21,6 +21,7 @@ class GeotiffReader(IterableDataset):
         img_path: Union[str, "Path"],
         crop_size: int,
         stride: Optional[int] = None,
+        band_order: Optional[List[int]] = None,
     ):
         """A Pytorch dataset that returns cropped segments of a tif image file.
 
@@ -29,12 +30,15 @@ class GeotiffReader(IterableDataset):
             crop_size: The desired edge length for each cropped section.
                 Returned images will be square.
             stride: The stride to use when cropping the image. Defaults to `crop_size`.
+            band_order: Optional 1-based band indices to read, in the order they
+                should be returned. Defaults to all bands in file order.
         """
         super().__init__()
 
         self.img_path = img_path
         self.crop_size = crop_size
         self.stride = stride if stride is not None else crop_size
+        self.band_order = band_order
 
         with rasterio.open(img_path, "r") as src:
             self.height = src.height
@@ -70,20 +74,31 @@ class GeotiffReader(IterableDataset):
     def is_right_window(self, window: Window):
         return window.col_off + window.width >= self.width
 
+    def _read_window(
+        self, src: "rasterio.DatasetReader", window: Window
+    ) -> "np.ndarray":
+        # Let GDAL read and reorder only the requested bands
+        crop = src.read(indexes=self.band_order, window=window)
+
+        if len(crop.shape) == 3:
+            crop = np.moveaxis(crop, 0, 2)  # (c, h, w) => (h, w, c)
+
+        return crop
+
     def __getitem__(self, idx: int) -> ("np.ndarray", Window):
         window = self.get_window(idx)
 
         with rasterio.open(self.img_path, "r") as src:
-            crop = src.read(window=window)
-
-        if len(crop.shape) == 3:
-            crop = np.moveaxis(crop, 0, 2)  # (c, h, w) => (h, w, c)
+            crop = self._read_window(src, window)
 
         return crop, window
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        # Open the image once for the whole pass instead of once per crop
+        with rasterio.open(self.img_path, "r") as src:
+            for i in range(len(self)):
+                window = self.get_window(i)
+                yield self._read_window(src, window), window
 
     @property
     def y0(self) -> List[int]:
@@ -40,6 +40,17 @@ class GeotiffWriter:
             self.width = dst.width
             self.profile = dst.profile
 
+        self._dst = None
+
+    def __enter__(self) -> "GeotiffWriter":
+        """Keep the file open for writing until the context exits."""
+        self._dst = rasterio.open(self.img_path, "r+")
+        return self
+
+    def __exit__(self, *exc_info):
+        self._dst.close()
+        self._dst = None
+
     @classmethod
     def from_reader(
         cls, img_path: Union[str, "Path"], reader: "GeotiffReader", **kwargs
@@ -63,10 +74,14 @@ class GeotiffWriter:
 
     def write_window(self, write_data: np.ndarray, window: Window):
         # Remove data that goes past the boundaries
+        # Labels usually already have the output dtype, so avoid copying them
         write_data = write_data[: window.height, : window.width].astype(
-            self.profile["dtype"]
+            self.profile["dtype"], copy=False
         )
 
-        # Write the data
-        with rasterio.open(self.img_path, "r+") as dst:
-            dst.write(write_data, 1, window=window)
+        # Write the data, reusing the open file when used as a context manager
+        if self._dst is not None:
+            self._dst.write(write_data, 1, window=window)
+        else:
+            with rasterio.open(self.img_path, "r+") as dst:
+                dst.write(write_data, 1, window=window)
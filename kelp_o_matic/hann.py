@@ -18,6 +18,7 @@ class Kernel(torch.nn.Module, metaclass=ABCMeta):
         self.size = size
         self.wi = self._init_wi(size, device)
         self.wj = self.wi.clone()
+        self._kernels = {}
 
     @staticmethod
     @abstractmethod
@@ -30,6 +31,15 @@ class Kernel(torch.nn.Module, metaclass=ABCMeta):
         bottom: bool = False,
         left: bool = False,
         right: bool = False,
+    ) -> torch.Tensor:
+        # The kernel depends only on the edge flags, so build each variant once
+        key = (top, bottom, left, right)
+        if key not in self._kernels:
+            self._kernels[key] = self._build_kernel(*key)
+        return self._kernels[key]
+
+    def _build_kernel(
+        self, top: bool, bottom: bool, left: bool, right: bool
     ) -> torch.Tensor:
         wi, wj = self.wi.clone(), self.wj.clone()
 
@@ -60,8 +70,8 @@ class Kernel(torch.nn.Module, metaclass=ABCMeta):
 class HannKernel(Kernel):
     @staticmethod
     def _init_wi(size: int, device: torch.device.type) -> torch.Tensor:
-        i = torch.arange(0, size, device=device)
-        return (1 - ((2 * np.pi * i) / (size - 1)).cos()) / 2
+        # (1 - cos(2 * pi * i / (size - 1))) / 2
+        return torch.hann_window(size, periodic=False, dtype=torch.float, device=device)
 
 
 class BartlettHannKernel(Kernel):
@@ -82,18 +92,18 @@ class BartlettHannKernel(Kernel):
 class TriangularKernel(Kernel):
     @staticmethod
     def _init_wi(size: int, device: torch.device.type) -> torch.Tensor:
-        i = torch.arange(0, size, device=device)
-        return 1 - (2 * i / size - 1).abs()
+        # 1 - |2 * i / size - 1|
+        return torch.bartlett_window(
+            size, periodic=True, dtype=torch.float, device=device
+        )
 
 
 class BlackmanKernel(Kernel):
     @staticmethod
     def _init_wi(size: int, device: torch.device.type) -> torch.Tensor:
-        i = torch.arange(0, size, device=device)
-        return (
-            0.42
-            - 0.5 * (2 * np.pi * i / size).cos()
-            + 0.08 * (4 * np.pi * i / size).cos()
+        # 0.42 - 0.5 * cos(2 * pi * i / size) + 0.08 * cos(4 * pi * i / size)
+        return torch.blackman_window(
+            size, periodic=True, dtype=torch.float, device=device
         )
 
 
@@ -116,13 +126,7 @@ class TorchMemoryRegister(object):
         self.height = self.ws
         self.width = (math.ceil(image_width / self.ws) * self.ws) + self.hws
         self.register = torch.zeros(
-            (self.n, self.height, self.width), device=self.device
-        )
-
-    @property
-    def _zero_chip(self):
-        return torch.zeros(
-            (self.n, self.hws, self.hws), dtype=torch.float, device=self.device
+            (self.n, self.height, self.width), dtype=torch.float, device=self.device
         )
 
     def step(
@@ -135,16 +139,23 @@ class TorchMemoryRegister(object):
         left: bool,
         right: bool,
     ):
-        # Read data from the registry to update with the new logits
+        # Accumulate the new logits directly into the registry
         # |a|b| |
         # |c|d| |
         with torch.no_grad():
+            kernel = self.kernel.get_kernel(
+                top=top, bottom=bottom, left=left, right=right
+            )
             logits_abcd = self.register[
                 :, :, img_window.col_off : img_window.col_off + self.ws
-            ].clone()
-            logits_abcd += self.kernel(
-                new_logits, top=top, bottom=bottom, left=left, right=right
-            )
+            ]
+            # Fused multiply-add of the windowed logits, avoiding a temporary
+            if right and bottom:
+                # Nothing is carried forward from the last window, so leave the
+                # registry untouched
+                logits_abcd = torch.addcmul(logits_abcd, new_logits, kernel)
+            else:
+                logits_abcd.addcmul_(new_logits, kernel)
 
         if right and bottom:
             # Need to return entire window
@@ -153,82 +164,53 @@ class TorchMemoryRegister(object):
 
         elif right:
             # Need to return a and b sections
-
-            # Update the registry and pop information-complete data
-            # |c|d| | + pop a+b
-            # |0|0| |
-            logits_ab = logits_abcd[:, : self.hws, :]
-            logits_cd = logits_abcd[:, self.hws :, :]
-            logits_00 = torch.concat([self._zero_chip, self._zero_chip], dim=2)
-
-            # write cd and 00
-            self.register[
-                :, : self.hws, img_window.col_off : img_window.col_off + self.ws
-            ] = logits_cd
-            self.register[
-                :, self.hws :, img_window.col_off : img_window.col_off + self.ws
-            ] = logits_00
-
             logits_win = Window(
                 col_off=img_window.col_off,
                 row_off=img_window.row_off,
                 height=min(self.hws, img_window.height),
                 width=min(self.ws, img_window.width),
             )
-            logits = logits_ab[:, : logits_win.height, : logits_win.width]
-        elif bottom:
-            # Need to return a and c sections only
-
-            # Update the registry and pop information-complete data
-            # |0|b| | + pop a+c
-            # |0|d| |
-            logits_ac = logits_abcd[:, :, : self.hws]
-            logits_00 = torch.concat([self._zero_chip, self._zero_chip], dim=1)
-            logits_bd = logits_abcd[:, :, self.hws :]
+            logits = logits_abcd[:, : logits_win.height, : logits_win.width].clone()
 
-            # write 00 and bd
-            self.register[:, :, img_window.col_off : img_window.col_off + self.hws] = (
-                logits_00  # Not really necessary since this is the last row
-            )
-            self.register[
-                :, :, img_window.col_off + self.hws : img_window.col_off + self.ws
-            ] = logits_bd
+            # Update the registry now that a+b have been popped
+            # |c|d| |
+            # |0|0| |
+            logits_abcd[:, : self.hws] = logits_abcd[:, self.hws :]
+            logits_abcd[:, self.hws :].zero_()
 
+        elif bottom:
+            # Need to return a and c sections only
             logits_win = Window(
                 col_off=img_window.col_off,
                 row_off=img_window.row_off,
                 height=min(self.ws, img_window.height),
                 width=min(self.hws, img_window.width),
             )
-            logits = logits_ac[:, : img_window.height, : img_window.width]
-        else:
-            # Need to return "a" section only
+            logits = logits_abcd[:, : logits_win.height, : logits_win.width].clone()
 
-            # Update the registry and pop information-complete data
-            # |c|b| | + pop a
+            # Update the registry now that a+c have been popped. b+d stay in place
+            # |0|b| |
             # |0|d| |
-            logits_a = logits_abcd[:, : self.hws, : self.hws]
-            logits_c = logits_abcd[:, self.hws :, : self.hws]
-            logits_c0 = torch.concat([logits_c, self._zero_chip], dim=1)
-            logits_bd = logits_abcd[:, :, self.hws :]
-
-            # write c0
-            self.register[:, :, img_window.col_off : img_window.col_off + self.hws] = (
-                logits_c0
-            )
-
-            # write bd
-            col_off_bd = img_window.col_off + self.hws
-            self.register[:, :, col_off_bd : col_off_bd + (self.ws - self.hws)] = (
-                logits_bd
-            )
+            logits_abcd[:, :, : self.hws].zero_()  # Not really necessary since last row
 
+        else:
+            # Need to return "a" section only
             logits_win = Window(
                 col_off=img_window.col_off,
                 row_off=img_window.row_off,
                 height=min(self.hws, img_window.height),
                 width=min(self.hws, img_window.width),
             )
-            logits = logits_a[:, : img_window.height, : img_window.width]
+            logits = logits_abcd[:, : logits_win.height, : logits_win.width].clone()
+
+            # Update the registry now that a has been popped. b+d stay in place
+            # |c|b| |
+            # |0|d| |
+            logits_c = logits_abcd[:, self.hws :, : self.hws]
+            if self.ws % 2:
+                # The halves of an odd-sized window overlap by one row
+                logits_c = logits_c.clone()
+            logits_abcd[:, : self.ws - self.hws, : self.hws] = logits_c
+            logits_abcd[:, self.ws - self.hws :, : self.hws].zero_()
 
         return logits, logits_win
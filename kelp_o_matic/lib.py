@@ -1,6 +1,6 @@
 import warnings
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Type, Union
 
 import rasterio
 
@@ -11,8 +11,17 @@ from kelp_o_matic.models import (
     KelpRGBPresenceSegmentationModel,
     KelpRGBSpeciesSegmentationModel,
     MusselRGBPresenceSegmentationModel,
+    _Model,
 )
 
+# Kelp model for each (use_nir, species) flag combination
+_KELP_MODELS: dict[tuple[bool, bool], Type[_Model]] = {
+    (False, False): KelpRGBPresenceSegmentationModel,
+    (False, True): KelpRGBSpeciesSegmentationModel,
+    (True, False): KelpRGBIPresenceSegmentationModel,
+    (True, True): KelpRGBISpeciesSegmentationModel,
+}
+
 
 def _validate_paths(source: Path, dest: Path):
     drivers = rasterio.drivers.raster_driver_extensions()
@@ -24,18 +33,12 @@ def _validate_paths(source: Path, dest: Path):
         except KeyError:
             return False
 
-    def file_exists(p: Path):
-        return p.exists() and p.is_file()
-
-    def dir_exists(p: Path):
-        return p.exists() and p.is_dir()
-
     # Check that input and output paths are tif files
     # Check that input path exists
-    if not file_exists(source):
+    if not source.is_file():
         raise ValueError("The source file does not exist.")
     # Check that output path parent exists
-    if not dir_exists(dest.parent):
+    if not dest.parent.is_dir():
         raise ValueError("The directory for path dest does not exist.")
     if not is_supported_file_type(source):
         raise ValueError("The specified source file is not supported by GDAL.")
@@ -50,6 +53,7 @@ def _validate_paths(source: Path, dest: Path):
 
 
 def _validate_band_order(band_order: list[int], use_nir: bool = False):
+    assert min(band_order) >= 1, "Band indices are 1-based and must be >= 1."
     if use_nir:
         assert len(band_order) >= 4, "RGBI ordering requires 4 bands."
         if len(band_order) > 4:
@@ -64,6 +68,29 @@ def _validate_band_order(band_order: list[int], use_nir: bool = False):
             )
 
 
+def _segment(
+    model_class: Type[_Model],
+    source: Path,
+    dest: Path,
+    band_order: list[int],
+    crop_size: int,
+    use_gpu: bool,
+    test_time_augmentation: bool,
+):
+    # Validate the paths before loading any model weights
+    _validate_paths(source, dest)
+
+    model = model_class(use_gpu=use_gpu)
+    RichSegmentationManager(
+        model,
+        source,
+        dest,
+        band_order=band_order,
+        crop_size=crop_size,
+        test_time_augmentation=test_time_augmentation,
+    )()
+
+
 def find_kelp(
     source: Union[str, Path],
     dest: Union[str, Path],
@@ -95,24 +122,16 @@ def find_kelp(
             band_order.append(4)
 
     _validate_band_order(band_order, use_nir)
-    _validate_paths(Path(source), Path(dest))
-
-    if use_nir and species:
-        model = KelpRGBISpeciesSegmentationModel(use_gpu=use_gpu)
-    elif use_nir:
-        model = KelpRGBIPresenceSegmentationModel(use_gpu=use_gpu)
-    elif species:
-        model = KelpRGBSpeciesSegmentationModel(use_gpu=use_gpu)
-    else:
-        model = KelpRGBPresenceSegmentationModel(use_gpu=use_gpu)
-    RichSegmentationManager(
-        model,
-        Path(source),
-        Path(dest),
+
+    _segment(
+        _KELP_MODELS[(bool(use_nir), bool(species))],
+        Path(source).expanduser(),
+        Path(dest).expanduser(),
         band_order=band_order,
         crop_size=crop_size,
+        use_gpu=use_gpu,
         test_time_augmentation=test_time_augmentation,
-    )()
+    )
 
 
 def find_mussels(
@@ -140,13 +159,12 @@ def find_mussels(
         band_order = [1, 2, 3]
 
     _validate_band_order(band_order)
-    _validate_paths(Path(source), Path(dest))
-    model = MusselRGBPresenceSegmentationModel(use_gpu=use_gpu)
-    RichSegmentationManager(
-        model,
-        Path(source),
-        Path(dest),
+    _segment(
+        MusselRGBPresenceSegmentationModel,
+        Path(source).expanduser(),
+        Path(dest).expanduser(),
         band_order=band_order,
         crop_size=crop_size,
+        use_gpu=use_gpu,
         test_time_augmentation=test_time_augmentation,
-    )()
+    )
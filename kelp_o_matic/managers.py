@@ -2,15 +2,16 @@ import warnings
 from pathlib import Path
 from typing import Union
 
+import numpy as np
 import rasterio
 import torch
-from rich import print
+from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TimeElapsedColumn
 
 from kelp_o_matic.geotiff_io import GeotiffReader, GeotiffWriter
 from kelp_o_matic.hann import BartlettHannKernel, TorchMemoryRegister
 from kelp_o_matic.models import _Model
-from kelp_o_matic.utils import all_same
+from kelp_o_matic.utils import all_same, prefetch
 
 
 class GeotiffSegmentationManager:
@@ -49,6 +50,7 @@ class GeotiffSegmentationManager:
             self.input_path,
             crop_size=crop_size,
             stride=crop_size // 2,
+            band_order=list(band_order),
         )
         self.writer = GeotiffWriter.from_reader(
             self.output_path,
@@ -69,25 +71,30 @@ class GeotiffSegmentationManager:
         """Run the segmentation task."""
         self.on_start()
         self._run_checks()
+        max_value = self._max_value
 
-        with rasterio.Env():
-            for index, batch in enumerate(self.reader):
+        with rasterio.Env(), self.writer:
+            # Read the next tile from disk while the current one is classified
+            for index, batch in enumerate(prefetch(self.reader)):
                 crop, read_window = batch
 
-                # Reorder bands
-                crop = crop[:, :, [b - 1 for b in self.band_order]]
-
-                if (crop == 0).all():
+                # any() checks for nonzero pixels without allocating a boolean mask
+                if not crop.any():
                     logits = self.model.shortcut(self.reader.crop_size)
                 else:
                     if self.model.transform:
-                        crop = self.model.transform(crop / self._max_value)
+                        # Scale straight to float32, the dtype the model consumes
+                        crop = np.divide(crop, max_value, dtype=np.float32)
+                        crop = self.model.transform(crop)
 
-                    # Zero pad to correct shape
+                    # Zero pad edge crops to correct shape
                     _, h, w = crop.shape
-                    crop = torch.nn.functional.pad(
-                        crop, (0, self.crop_size - w, 0, self.crop_size - h), value=0
-                    )
+                    if h < self.crop_size or w < self.crop_size:
+                        crop = torch.nn.functional.pad(
+                            crop,
+                            (0, self.crop_size - w, 0, self.crop_size - h),
+                            value=0,
+                        )
                     if self.tta:
                         all_logits = []
                         for flip in [False, True]:
@@ -143,7 +150,7 @@ class GeotiffSegmentationManager:
         elif self._dtype == "uint16":
             return 65535
         else:
-            raise AssertionError(f"Unknown dtype {self.dtype}.")
+            raise AssertionError(f"Unknown dtype {self._dtype}.")
 
     def _dtype_check(self):
         if self._dtype not in ["uint8", "uint16"]:
@@ -213,8 +220,13 @@ class RichSegmentationManager(GeotiffSegmentationManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        # Messages are fully marked up, so skip Rich's regex-based highlighting
+        self.console = Console(highlight=False)
         self.progress = Progress(
-            SpinnerColumn("dots"), *Progress.get_default_columns(), TimeElapsedColumn()
+            SpinnerColumn("dots"),
+            *Progress.get_default_columns(),
+            TimeElapsedColumn(),
+            console=self.console,
         )
         self.processing_task = self.progress.add_task(
             description="Processing", total=len(self.reader)
@@ -226,11 +238,11 @@ class RichSegmentationManager(GeotiffSegmentationManager):
 
     def on_start(self):
         device_emoji = ":rocket:" if self.model.device.type == "cuda" else ":snail:"
-        print(f"Running with [magenta]{self.model.device} {device_emoji}")
+        self.console.print(f"Running with [magenta]{self.model.device} {device_emoji}")
 
     def on_tile_write(self, index: int):
         self.progress.update(self.processing_task, completed=index)
 
     def on_end(self):
         self.progress.update(self.processing_task, completed=len(self.reader))
-        print("[bold italic green]:tada: Segmentation complete! :tada:[/]")
+        self.console.print("[bold italic green]:tada: Segmentation complete! :tada:[/]")
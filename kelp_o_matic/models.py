@@ -9,6 +9,19 @@ from PIL.Image import Image
 
 from kelp_o_matic.utils import lazy_load_params
 
+# ImageNet normalization constants, shaped to broadcast over (C, H, W) crops
+_IMAGENET_MEAN = torch.tensor([0.485, 0.456, 0.406], dtype=torch.float).view(-1, 1, 1)
+_IMAGENET_STD = torch.tensor([0.229, 0.224, 0.225], dtype=torch.float).view(-1, 1, 1)
+_IMAGENET_INV_STD = _IMAGENET_STD.reciprocal()
+
+
+def _to_tensor(x: Union[np.ndarray, Image], n_bands: int) -> torch.Tensor:
+    if isinstance(x, np.ndarray):
+        # Select, transpose to (C, H, W) and cast to float32 in a single copy
+        x = x[:, :, :n_bands].transpose(2, 0, 1)
+        return torch.from_numpy(np.ascontiguousarray(x, dtype=np.float32))
+    return f.to_tensor(x)[:n_bands, :, :].to(torch.float)
+
 
 class _Model(ABC):
     register_depth = 2
@@ -16,9 +29,8 @@ class _Model(ABC):
 
     @staticmethod
     def transform(x: Union[np.ndarray, Image]) -> torch.Tensor:
-        x = f.to_tensor(x)[:3, :, :].to(torch.float)
-        x = f.normalize(x, mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
-        return x
+        x = _to_tensor(x, 3)
+        return x.sub_(_IMAGENET_MEAN).mul_(_IMAGENET_INV_STD)
 
     def __init__(self, use_gpu: bool = True):
         is_cuda = torch.cuda.is_available() and use_gpu
@@ -46,7 +58,8 @@ class _Model(ABC):
             return self.model.forward(x.to(self.device))
 
     def post_process(self, x: "torch.Tensor") -> "np.ndarray":
-        return x.argmax(dim=0).detach().cpu().numpy()
+        # Narrow to uint8 on the device so less data is copied back to the host
+        return x.argmax(dim=0).to(torch.uint8).detach().cpu().numpy()
 
     def shortcut(self, crop_size: int):
         """Shortcut prediction for when we know a cropped section is background.
@@ -81,28 +94,31 @@ class _SpeciesSegmentationModel(_Model, metaclass=ABCMeta):
 
     def post_process(self, x: "torch.Tensor") -> "np.ndarray":
         with torch.no_grad():
-            presence = torch.argmax(x[:2], dim=0)  # 0: bg, 1: kelp
-            species = torch.argmax(x[2:], dim=0) + 2  # 2: macro, 3: nereo
-            label = torch.mul(presence, species)  # 0: bg, 2: macro, 3: nereo
+            label = torch.argmax(x[2:], dim=0).add_(2)  # 2: macro, 3: nereo
+            # Background wherever argmax of the presence logits is 0
+            label.masked_fill_(x[1] <= x[0], 0)  # 0: bg, 2: macro, 3: nereo
 
-        return label.detach().cpu().numpy()
+        return label.to(torch.uint8).detach().cpu().numpy()
 
 
-class KelpRGBPresenceSegmentationModel(_Model):
+class _BinarySegmentationModel(_Model, metaclass=ABCMeta):
     register_depth = 1
     all_black_val = 0
 
-    torchscript_path = (
-        "UNetPlusPlus_EfficientNetV2_m_kelp_presence_rgb_jit_dice=0.8703.pt"
-    )
-
     def post_process(self, x: "torch.Tensor") -> "np.ndarray":
         with torch.no_grad():
-            label = (torch.sigmoid(x) > 0.5).to(torch.uint8)[0]
+            # sigmoid(x) > 0.5 iff x > 0, so threshold the logits directly
+            label = (x[0] > 0).to(torch.uint8)
 
         return label.detach().cpu().numpy()
 
 
+class KelpRGBPresenceSegmentationModel(_BinarySegmentationModel):
+    torchscript_path = (
+        "UNetPlusPlus_EfficientNetV2_m_kelp_presence_rgb_jit_dice=0.8703.pt"
+    )
+
+
 class KelpRGBSpeciesSegmentationModel(_SpeciesSegmentationModel):
     register_depth = 3
     all_black_val = 0
@@ -114,38 +130,25 @@ class KelpRGBSpeciesSegmentationModel(_SpeciesSegmentationModel):
 
     def post_process(self, x: "torch.Tensor") -> "np.ndarray":
         with torch.no_grad():
-            presence = (torch.sigmoid(x[0]) > 0.5).to(torch.uint8)  # 0: bg, 1: kelp
-            species = torch.argmax(x[1:], dim=0) + 2  # 2: macro, 3: nereo
-            label = torch.mul(presence, species)  # 0: bg, 2: macro, 3: nereo
-
-        return label.detach().cpu().numpy()
+            label = torch.argmax(x[1:], dim=0).add_(2)  # 2: macro, 3: nereo
+            label.masked_fill_(x[0] <= 0, 0)  # 0: bg, 2: macro, 3: nereo
 
+        return label.to(torch.uint8).detach().cpu().numpy()
 
-class MusselRGBPresenceSegmentationModel(_Model):
-    register_depth = 1
-    all_black_val = 0
 
+class MusselRGBPresenceSegmentationModel(_BinarySegmentationModel):
     torchscript_path = (
         "UNetPlusPlus_EfficientNetB4_mussel_presence_rgb_jit_dice=0.9269.pt"
     )
 
-    def post_process(self, x: "torch.Tensor") -> "np.ndarray":
-        with torch.no_grad():
-            label = (torch.sigmoid(x) > 0.5).to(torch.uint8)[0]
-
-        return label.detach().cpu().numpy()
-
 
 def _rgbi_kelp_transform(x: Union[np.ndarray, Image]) -> torch.Tensor:
     # to float
-    x = f.to_tensor(x)[:4, :, :].to(torch.float)
-    # min-max scale
-    x_unique = x.flatten().unique()
-    min_ = x_unique[0]
-    if len(x_unique) > 1:
-        min_, _ = torch.kthvalue(x_unique, 2)
-    max_ = x.flatten().max()
-    return torch.clamp((x - min_) / (max_ - min_ + 1e-8), 0, 1)
+    x = _to_tensor(x, 4)
+    # min-max scale, using the second smallest unique value as the minimum
+    min_, max_ = torch.aminmax(x)
+    min_ = torch.where(x > min_, x, max_).min()
+    return x.sub_(min_).div_(max_ - min_ + 1e-8).clamp_(0, 1)
 
 
 class KelpRGBIPresenceSegmentationModel(_Model):
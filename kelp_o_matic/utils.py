@@ -1,65 +1,113 @@
 import os
+import queue
 import shutil
 import tempfile
+import threading
 import urllib.request
 from pathlib import Path
+from typing import Iterable, Iterator, TypeVar
 
 from rich.progress import Progress
 
 S3_BUCKET = "https://kelp-o-matic.s3.amazonaws.com/pt_jit"
 CACHE_DIR = Path("~/.cache/kelp_o_matic").expanduser()
 
+T = TypeVar("T")
+
 
 def lazy_load_params(object_name: str):
     object_name = object_name
     remote_url = f"{S3_BUCKET}/{object_name}"
     local_file = CACHE_DIR / object_name
 
-    # Create cache directory if it doesn't exist
-    if not CACHE_DIR.is_dir():
-        CACHE_DIR.mkdir(parents=True)
-
     # Download file if it doesn't exist
     if not local_file.is_file():
+        # Create cache directory if it doesn't exist
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
         download_file(remote_url, local_file)
 
     return local_file
 
 
 def download_file(url: str, filename: Path):
-    # Make a request to the URL
-    response = urllib.request.urlopen(url)
+    # Make a request to the URL, closing the connection once downloaded
+    with urllib.request.urlopen(url) as response:
+        # Get the total size of the file
+        file_size = int(response.getheader("Content-Length"))
+
+        # Create a task with the total file size
+        with Progress(transient=True) as progress:
+            task = progress.add_task(f"Downloading {filename.name}...", total=file_size)
+
+            # Download the file
+            try:
+                with tempfile.NamedTemporaryFile("wb", delete=False) as f:
+                    # Read data in 1 MiB chunks
+                    while True:
+                        chunk = response.read(1 << 20)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+
+                        # Update progress bar
+                        progress.update(task, advance=len(chunk))
+
+                    # Move the file to the cache directory once downloaded
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                shutil.move(f.name, filename)
+            except Exception as e:
+                if f and os.path.exists(f.name):
+                    os.remove(f.name)
+                raise e
+
 
-    # Get the total size of the file
-    file_size = int(response.getheader("Content-Length"))
+def all_same(items):
+    return all(x == items[0] for x in items)
 
-    # Create a task with the total file size
-    with Progress(transient=True) as progress:
-        task = progress.add_task(f"Downloading {filename.name}...", total=file_size)
 
-        # Download the file
+def prefetch(iterable: Iterable[T], size: int = 2) -> Iterator[T]:
+    """Iterate over `iterable` while a background thread reads up to `size` items
+    ahead, so slow IO can overlap with processing of the current item."""
+    buffer = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    done = object()
+
+    def put(item) -> bool:
+        # Block until there is space, giving up if the consumer has stopped
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        it = iter(iterable)
         try:
-            with tempfile.NamedTemporaryFile("wb", delete=False) as f:
-                # Read data in chunks (e.g., 1024 bytes)
-                while True:
-                    chunk = response.read(1024)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-
-                    # Update progress bar
-                    progress.update(task, advance=len(chunk))
-
-                # Move the file to the cache directory once downloaded
-                f.flush()
-                os.fsync(f.fileno())
-
-            shutil.move(f.name, filename)
+            for item in it:
+                if not put((item, None)):
+                    return
+            put((done, None))
         except Exception as e:
-            if f and os.path.exists(f.name):
-                os.remove(f.name)
-            raise e
-
-
-def all_same(items):
-    return all(x == items[0] for x in items)
+            put((done, e))
+        finally:
+            # Release resources held by generators in the thread that used them
+            if hasattr(it, "close"):
+                it.close()
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
@@ -5,7 +5,14 @@ import torch
 from rasterio.transform import from_origin
 from rasterio.windows import Window
 
-from kelp_o_matic.hann import BartlettHannKernel, Kernel, TorchMemoryRegister
+from kelp_o_matic.hann import (
+    BartlettHannKernel,
+    BlackmanKernel,
+    HannKernel,
+    Kernel,
+    TorchMemoryRegister,
+    TriangularKernel,
+)
 
 
 def create_dummy_tiff(
@@ -379,3 +386,36 @@ def test_kernel_sum():
     a = output[0].numpy()
     # Each output pixels should sum to 1
     assert np.allclose(a, 1.0)
+
+
+def test_kernel_variants_are_cached():
+    kernel = BartlettHannKernel(size=8, device=torch.device("cpu"))
+
+    k = kernel.get_kernel(top=True, left=True)
+    assert kernel.get_kernel(top=True, left=True) is k
+    assert kernel.get_kernel(bottom=True) is not k
+
+    # Cached variants match the kernel built from the 1D windows
+    wi, wj = kernel.wi.clone(), kernel.wj.clone()
+    wi[:4] = 1
+    wj[:4] = 1
+    assert torch.allclose(k, wi.unsqueeze(1) @ wj.unsqueeze(0))
+
+
+@pytest.mark.parametrize("size", [8, 125, 256])
+def test_window_functions(size):
+    i = torch.arange(0, size)
+    device = torch.device("cpu")
+
+    hann = (1 - ((2 * np.pi * i) / (size - 1)).cos()) / 2
+    assert torch.allclose(HannKernel._init_wi(size, device), hann, atol=1e-6)
+
+    triangular = 1 - (2 * i / size - 1).abs()
+    assert torch.allclose(
+        TriangularKernel._init_wi(size, device), triangular, atol=1e-6
+    )
+
+    blackman = (
+        0.42 - 0.5 * (2 * np.pi * i / size).cos() + 0.08 * (4 * np.pi * i / size).cos()
+    )
+    assert torch.allclose(BlackmanKernel._init_wi(size, device), blackman, atol=1e-6)
@@ -103,3 +103,22 @@ def test_y0x0_getters(tmpdir):
     ds = GeotiffReader(p, crop_size=1)
     assert ds.y0 == [0, 1]
     assert ds.x0 == [0, 1]
+
+
+def test_iter_matches_getitem(tmpdir):
+    p = _create_simple_3band_img(tmpdir)
+    ds = GeotiffReader(p, crop_size=1)
+    for i, (c, w) in enumerate(ds):
+        expected_c, expected_w = ds[i]
+        assert np.all(c == expected_c)
+        assert w == expected_w
+
+
+def test_band_order(tmpdir):
+    p = _create_simple_3band_img(tmpdir)
+    ds = GeotiffReader(p, crop_size=2, band_order=[3, 1])
+    c, _ = ds[0]
+    assert c.shape == (2, 2, 2)
+    assert np.all(c[:, :, 0] == np.array([[213, 123], [33, 243]]))
+    assert np.all(c[:, :, 1] == np.array([[11, 221], [131, 41]]))
+    assert np.all(next(iter(ds))[0] == c)
@@ -0,0 +1,34 @@
+import pytest
+
+from kelp_o_matic.utils import prefetch
+
+
+def test_prefetch_preserves_order():
+    assert list(prefetch(range(100), size=3)) == list(range(100))
+    assert list(prefetch([])) == []
+
+
+def test_prefetch_raises_producer_errors():
+    def gen():
+        yield 1
+        raise ValueError("bad tile")
+
+    it = prefetch(gen())
+    assert next(it) == 1
+    with pytest.raises(ValueError, match="bad tile"):
+        next(it)
+
+
+def test_prefetch_closes_source_when_stopped_early():
+    closed = []
+
+    def gen():
+        try:
+            yield from range(100)
+        finally:
+            closed.append(True)
+
+    it = prefetch(gen())
+    assert next(it) == 0
+    it.close()
+    assert closed == [True]